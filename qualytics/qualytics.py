@@ -1,23 +1,40 @@
 import time
+import atexit
+import base64
+import contextlib
+import functools
 
 import typer
+import orjson
 import os
 import json
 import requests
 import urllib3
 import re
-import jwt
 import platform
+import socket
 import subprocess
+import sys
+import tempfile
+import threading
 
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
 from pathlib import Path
-from rich import print
+from rich import print, reconfigure
 from rich.progress import track
-from itertools import product
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+from itertools import chain, islice
+from operator import itemgetter
 from typing import Optional
 from typing_extensions import Annotated
-from croniter import croniter
+
+# Output redirected to a file or CI log is never colored, so skip rich's
+# automatic highlighting of numbers and strings in every printed line there
+reconfigure(highlight=sys.stdout.isatty())
 
 __version__ = "0.1.19"
 
@@ -55,6 +72,90 @@ CRONTAB_COMMANDS_PATH = os.path.expanduser(f"{BASE_PATH}/schedule-operation.txt"
 OPERATION_ERROR_PATH = os.path.expanduser(f"{BASE_PATH}/operation-error.txt")
 
 
+def _positive_env(name: str, default, cast=int):
+    """
+    Reads a positive number from the environment variable `name`.
+
+    Values that aren't positive numbers are reported and replaced by `default`,
+    so a bad setting can't keep every command, even --help, from starting.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        number = cast(value)
+    except ValueError:
+        number = None
+    if number is None or not 0 < number < float("inf"):
+        typer.secho(
+            f"Ignoring {name}={value!r}, it must be a positive number. Using {default}.",
+            fg=typer.colors.YELLOW,
+            err=True,
+        )
+        return default
+    return number
+
+
+# Maximum number of page requests in flight at once across the whole process
+MAX_CONCURRENCY = 8
+_PAGE_REQUESTS = threading.BoundedSemaphore(MAX_CONCURRENCY)
+
+# Keep-alive connections pooled per host, which also bounds --concurrency so
+# parallel imports never open more connections than the pool keeps
+POOL_SIZE = 32
+
+# Number of items requested per page, servers with a lower limit fall back to the smaller size
+DEFAULT_PAGE_SIZE = _positive_env("QUALYTICS_PAGE_SIZE", 500)
+FALLBACK_PAGE_SIZE = 100
+
+# An item of a comma-separated or array-like option: the text between commas and
+# brackets, without surrounding whitespace but keeping inner spaces
+_LIST_ITEM_RE = re.compile(r"[^,\[\]\s](?:[^,\[\]]*[^,\[\]\s])?")
+
+# The id of the existing quality check mentioned in a 409 Conflict response
+_CONFLICT_ID_RE = re.compile(r"id: (\d+)")
+
+# Names of the fields and tags of exported quality checks
+_get_name = itemgetter("name")
+
+# Values of an exported quality check copied as-is into the import payload
+_quality_check_values = itemgetter(
+    "description", "rule_type", "coverage", "is_new", "filter", "properties", "status"
+)
+
+# Error bodies are truncated to this many bytes unless QUALYTICS_DEBUG is set
+MAX_ERROR_DETAILS_SIZE = 4096
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Exported files are written through a larger buffer to cut down on write calls
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# Connect and read timeouts, in seconds, for requests that don't set their own.
+# The read timeout only applies to GET requests, since writes such as starting
+# an operation can take long and aren't retried when they time out
+REQUEST_TIMEOUT = (5, _positive_env("QUALYTICS_TIMEOUT", 30.0, cast=float))
+
+# CA bundle used to verify the server certificate instead of the default one
+CA_BUNDLE = os.environ.get("QUALYTICS_CA_BUNDLE")
+
+# Skips the certificate verification, for deployments using self-signed certificates
+INSECURE = os.environ.get("QUALYTICS_INSECURE", "").strip().lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+# Keep idle pooled connections alive through NATs and load balancers during
+# long imports and exports
+SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+]
+
+_SESSIONS: dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
 def validate_and_format_url(url: str) -> str:
     """Validates and formats the URL to the desired structure."""
 
@@ -66,7 +167,9 @@ def validate_and_format_url(url: str) -> str:
             url = "https://" + url
 
     # Remove any trailing slashes or '/api' or '/api/'
-    url = url.rstrip("/").rstrip("/api").rstrip("/")
+    url = url.rstrip("/")
+    if url.endswith("/api"):
+        url = url[: -len("/api")].rstrip("/")
 
     # Append '/api/' to the URL
     url += "/api/"
@@ -74,12 +177,25 @@ def validate_and_format_url(url: str) -> str:
     return url
 
 
+def _parse_comma_list(value: str) -> list[str]:
+    """Parses a comma-separated or array-like option value. Example: "a, b" or "[a,b]"."""
+    return _LIST_ITEM_RE.findall(value)
+
+
+def _parse_int_list(value: str) -> list[int]:
+    """Parses a comma-separated or array-like option value of integer IDs."""
+    return list(map(int, _LIST_ITEM_RE.findall(value)))
+
+
 def save_config(data):
     os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
     with open(CONFIG_PATH, "w") as f:
         json.dump(data, f, indent=4)
+    load_config.cache_clear()
 
 
+# The configuration is read once per invocation, save_config drops the cached copy
+@functools.lru_cache(maxsize=1)
 def load_config():
     if os.path.exists(CONFIG_PATH):
         with open(CONFIG_PATH, "r") as f:
@@ -91,18 +207,95 @@ def _get_default_headers(token):
     return {"Authorization": f"Bearer {token}"}
 
 
-def distinct_file_content(file_path):
-    # Check if the file exists before opening it
-    if not os.path.exists(file_path):
-        return  # Return early if the file doesn't exist
+def _error_details(response: requests.Response) -> str:
+    """
+    Returns the body of an error response for display or logging.
+
+    Only the first bytes are decoded, large error pages such as 5xx stack traces
+    would otherwise go through charset detection and flood the error log.
+    """
+    content = response.content
+    if os.environ.get("QUALYTICS_DEBUG") or len(content) <= MAX_ERROR_DETAILS_SIZE:
+        return content.decode("utf-8", errors="replace")
+    details = content[:MAX_ERROR_DETAILS_SIZE].decode("utf-8", errors="replace")
+    return f"{details}… (truncated)"
+
+
+def _decode(response: requests.Response):
+    """Parses a JSON response body with orjson."""
+    return orjson.loads(response.content)
+
+
+def _encode(payload, indent: bool = False) -> bytes:
+    """Serializes a JSON document with orjson, indented by 2 spaces if `indent`."""
+    return orjson.dumps(payload, option=orjson.OPT_INDENT_2 if indent else None)
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that applies REQUEST_TIMEOUT to requests sent without a timeout
+    and opens its connections with SOCKET_OPTIONS. Other methods than GET only
+    get the connect timeout.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = (
+                REQUEST_TIMEOUT
+                if request.method == "GET"
+                else (REQUEST_TIMEOUT[0], None)
+            )
+        return super().send(request, timeout=timeout, **kwargs)
+
+
+def get_session(token: str) -> requests.Session:
+    """
+    Returns the HTTP session shared by every request made with `token`.
+
+    Sessions are created once per process and already carry the authorization
+    header. They keep a pool of keep-alive connections large enough for the
+    concurrent page requests, and transparently retry idempotent requests
+    when the server is rate limiting or temporarily unavailable. Requests that
+    don't pass a timeout use REQUEST_TIMEOUT so a stalled connection can't hang
+    the CLI, see _TimeoutHTTPAdapter. Server certificates are verified against
+    CA_BUNDLE, or the default CA bundle when it's unset, unless INSECURE is set.
+    """
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(token)
+        if session is None:
+            retries = Retry(
+                total=5,
+                backoff_factor=0.25,
+                status_forcelist=(429, 502, 503, 504),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            adapter = _TimeoutHTTPAdapter(
+                pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retries
+            )
+            session = requests.Session()
+            session.headers.update(_get_default_headers(token))
+            session.verify = False if INSECURE else CA_BUNDLE or True
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSIONS[token] = session
+    return session
 
-    with open(file_path, "r") as file:
-        # Using a set to automatically get distinct lines
-        distinct_lines = set(file.readlines())
 
-    with open(file_path, "w") as file:
-        for line in distinct_lines:
-            file.write(line)
+def reset_session_cache():
+    """Closes and forgets every shared session, e.g. after the configuration changes."""
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+
+
+# Close pooled connections cleanly when the CLI exits
+atexit.register(reset_session_cache)
 
 
 def log_error(message, file_path):
@@ -116,205 +309,471 @@ def log_error(message, file_path):
         file.flush()
 
 
-def get_quality_checks(
-    base_url: str,
-    token: str,
-    datastore_id: int,
-    containers: list[int] | None,
-    tags: list[str] | None,
-    status: list[str] | None,
-):
-    endpoint = "quality-checks"
-    url = f"{base_url}{endpoint}?datastore={datastore_id}"
+class _ErrorLog:
+    """
+    Appends error messages to `file_path`, keeping the file open for a whole command.
 
-    if containers:
-        containers_string = "".join(
-            f"&container={container}" for container in containers
-        )
-        url += containers_string
+    The file is only created once the first error is logged. Messages already in
+    the file, or logged before, are skipped so it holds each error once. Writes
+    are buffered and serialized, so a single log can be shared by worker threads.
+    """
 
-    if tags:
-        tags_string = "".join(f"&tag={tag}" for tag in tags)
-        url += tags_string
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._file = None
+        self._logged = set()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._file is not None:
+            self._file.close()
+
+    def log(self, message: str):
+        line = message + "\n"
+        with self._lock:
+            if self._file is None:
+                # Earlier runs of the day append to the same file
+                if os.path.exists(self.file_path):
+                    with open(self.file_path, "r") as file:
+                        self._logged.update(file)
+                self._file = open(self.file_path, "a", buffering=WRITE_BUFFER_SIZE)
+            if line in self._logged:
+                return
+            self._logged.add(line)
+            self._file.write(line)
 
-    status_string = ""
-    if status:
-        archived_only = False
-        active_or_draft_count = 0
 
-        # Process each status
-        for check_status in status:
-            check_status = check_status.lower()
+def _exit_on_certificate_error(error: requests.exceptions.SSLError):
+    """Exits explaining how to trust the server certificate that failed to verify."""
+    typer.secho(
+        f"Failed to verify the server certificate: {error}. Set QUALYTICS_CA_BUNDLE to the CA bundle that signed it, or QUALYTICS_INSECURE=1 to skip the verification for self-signed certificates.",
+        fg=typer.colors.RED,
+    )
+    raise typer.Exit(code=1)
 
-            if check_status not in ["active", "draft", "archived"]:
-                print(
-                    f"[bold red] The following status: {check_status} doesn't exist [/bold red]"
-                )
-            elif check_status == "archived":
-                archived_only = True
-            elif check_status in ["active", "draft"]:
-                active_or_draft_count += 1
 
-        # If archived is present, we only use archived=only and skip others
-        if archived_only:
-            status_string = "&archived=only"
-        # If only one of active or draft is present, append it
-        elif active_or_draft_count == 1:
-            for check_status in status:
-                if check_status in ["active", "draft"]:
-                    status_string += f"&status={check_status.capitalize()}"
-
-        # Add status_string to the url
-        url += status_string
-    else:
-        status = "Active"
+def _get_page(url: str, token: str, params: dict, page: int):
+    try:
+        with _PAGE_REQUESTS:
+            return get_session(token).get(
+                url,
+                params={**params, "page": page},
+            )
+    except requests.exceptions.SSLError as e:
+        _exit_on_certificate_error(e)
 
-    page = 1
-    size = 100
-    params = {"sort_created": "asc", "size": size, "page": page}
 
-    response = requests.get(
-        url, headers=_get_default_headers(token), params=params, verify=False
-    )
+def _get_first_page(url: str, token: str, params: dict, resource: str):
+    """
+    Requests the first page of a paginated endpoint.
+
+    Updates params["size"] in place with the page size the server actually used,
+    so the following pages are requested and counted consistently.
+    """
+    response = _get_page(url, token, params, page=1)
+
+    # The server rejects page sizes above its maximum, retry with the smaller size
+    if response.status_code == 422 and params["size"] > FALLBACK_PAGE_SIZE:
+        params["size"] = FALLBACK_PAGE_SIZE
+        response = _get_page(url, token, params, page=1)
+
+    data = _check_page(response, resource)
+
+    # Check if "total" is in the response data
+    if "total" not in data:
+        typer.secho(
+            f"Unexpected server response. 'total' field missing in: {data}. Please verify if your credentials are correct.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(code=1)
 
+    params["size"] = data.get("size") or params["size"]
+
+    return data
+
+
+def _check_page(response, resource: str) -> dict:
+    """
+    Decodes a page of `resource`, exiting with an error when the request failed.
+
+    Every page goes through here, as a rate limited or failing page can still
+    be returned once the retries are exhausted.
+    """
     # Check for non-success status codes
     if response.status_code != 200:
         typer.secho(
-            f"Failed to retrieve quality checks. Server responded with: {response.status_code} - {response.text}. Please verify if your credentials are correct.",
+            f"Failed to retrieve {resource}. Server responded with: {response.status_code} - {_error_details(response)}. Please verify if your credentials are correct.",
             fg=typer.colors.RED,
         )
         raise typer.Exit(code=1)
 
-    data = response.json()
+    data = _decode(response)
 
-    # Check if "total" is in the response data
-    if "total" not in data:
+    if "items" not in data:
         typer.secho(
-            f"Unexpected server response. 'total' field missing in: {data}. Please verify if your credentials are correct.",
+            f"Unexpected server response. 'items' field missing in: {data}.",
             fg=typer.colors.RED,
         )
         raise typer.Exit(code=1)
 
-    total = data["total"]
-    all_quality_checks = []
+    return data
 
-    total_pages = -(-total // size)
 
-    # Loop through the pages based on total number and size
-    for current_page in track(
-        range(total_pages), description="Exporting quality checks..."
-    ):
-        # Append the current page's data to the concatenated array
-        all_quality_checks.extend(data["items"])
+def _page_count(data: dict, size: int) -> int:
+    # A short first page means the server has nothing left to return
+    if len(data["items"]) < size:
+        return 1
+    return -(-data["total"] // size)
 
-        total -= size
-        page += 1
 
-        params["page"] = page
-        response = requests.get(
-            url, headers=_get_default_headers(token), params=params, verify=False
-        )
-        data = response.json()
+def _fetch_all_pages(
+    url: str,
+    token: str,
+    params: dict,
+    resource: str,
+    description: str | None = None,
+    max_concurrency: int = MAX_CONCURRENCY,
+):
+    """
+    Fetches every page of a paginated endpoint.
 
-    print(f"[bold green] Total of Quality Checks = {data['total']} [/bold green]")
-    print(f"[bold green] Total pages = {total_pages} [/bold green]")
-    return all_quality_checks
+    The first page is requested on its own to learn the total number of items,
+    the remaining pages are then requested concurrently and reassembled in order.
+    """
+    data = _get_first_page(url, token, params, resource)
+
+    total_pages = _page_count(data, params["size"])
+    pages = [None] * total_pages
+    pages[0] = data["items"]
+
+    def fetch_page(page: int):
+        response = _get_page(url, token, params, page=page)
+        return page, _check_page(response, resource)["items"]
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        futures = [
+            executor.submit(fetch_page, page) for page in range(2, total_pages + 1)
+        ]
+        completed = as_completed(futures)
+        if description:
+            completed = track(completed, total=len(futures), description=description)
+        try:
+            for future in completed:
+                page, items = future.result()
+                pages[page - 1] = items
+        finally:
+            # A page failed, don't request the ones that haven't started yet
+            for future in futures:
+                future.cancel()
+
+    return list(chain.from_iterable(pages))
+
+
+class _PageItems:
+    """
+    The items of a paginated endpoint, produced lazily while being iterated.
+
+    `total` is the number of items the server reported with the first page.
+    """
+
+    def __init__(self, items, total: int):
+        self._items = items
+        self.total = total
+
+    def __iter__(self):
+        return self._items
+
+
+def _iter_pages(url: str, token: str, params: dict, resource: str, prefetch: int = 1):
+    """
+    Lazily yields the items of a paginated endpoint, as a _PageItems.
+
+    The first page is requested right away so errors surface immediately. Up to
+    `prefetch` upcoming pages are then requested in the background while the
+    current one is being consumed, so callers receive items early, only hold a
+    few pages in memory and can stop without downloading the remaining pages.
+    """
+    data = _get_first_page(url, token, params, resource)
+    return _PageItems(
+        _generate_page_items(url, token, params, resource, data, prefetch),
+        total=data["total"],
+    )
 
 
-def get_quality_check_by_additional_metadata(
-    base_url: str, token: str, additional_metadata: dict
+def _generate_page_items(
+    url: str, token: str, params: dict, resource: str, first_page: dict, prefetch: int
 ):
-    endpoint = "quality-checks"
-    quality_check_key = "from quality check id"
-    datastore_id_key = "main datastore id"
-    params = {
-        "datastore": additional_metadata[datastore_id_key],
-        "search": f'"{quality_check_key}": "{additional_metadata[quality_check_key]}", "{datastore_id_key}": "{additional_metadata[datastore_id_key]}"',
-    }
-    url = f"{base_url}{endpoint}"
+    pages = iter(range(2, _page_count(first_page, params["size"]) + 1))
 
-    response = requests.get(
-        url, headers=_get_default_headers(token), params=params, verify=False
+    with ThreadPoolExecutor(max_workers=prefetch) as executor:
+        pending = deque(
+            executor.submit(_get_page, url, token, params, page)
+            for page in islice(pages, prefetch)
+        )
+        try:
+            yield from first_page["items"]
+            while pending:
+                response = pending.popleft().result()
+                page = next(pages, None)
+                if page is not None:
+                    pending.append(executor.submit(_get_page, url, token, params, page))
+                yield from _check_page(response, resource)["items"]
+        finally:
+            # The consumer stopped early, drop the pages it will never read
+            for future in pending:
+                future.cancel()
+
+
+def _map_unordered(func, arguments, max_workers: int):
+    """
+    Calls `func(*args)` for every tuple of `arguments` on a thread pool.
+
+    Results are yielded as the calls complete, in no particular order. The
+    arguments are consumed lazily, keeping at most twice `max_workers` calls
+    queued, so large inputs are never turned into futures all at once.
+    """
+    arguments = iter(arguments)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {
+            executor.submit(func, *args) for args in islice(arguments, 2 * max_workers)
+        }
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                pending.update(
+                    executor.submit(func, *args)
+                    for args in islice(arguments, len(done))
+                )
+                for future in done:
+                    yield future.result()
+        finally:
+            # The consumer stopped or a call failed, drop the queued calls
+            for future in pending:
+                future.cancel()
+
+
+@contextlib.contextmanager
+def _replace_file(path: str):
+    """
+    Opens a temporary file next to `path` for binary writing, moved over `path`
+    only once the block completes, so a failed or interrupted export leaves
+    the previous file untouched.
+    """
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp"
     )
+    try:
+        with os.fdopen(fd, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            yield f
+        # mkstemp only grants access to the owner, give the permissions a
+        # plain open would have
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temp_path, 0o666 & ~umask)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _write_json_array(items, file, indent: bool = True) -> int:
+    """
+    Writes items to the binary `file` as a JSON array, one item at a time.
 
-    if response.status_code == 200:
-        quality_check = response.json()["items"]
+    The output is the same as _encode(list(items), indent) without holding
+    the whole list in memory. Returns the number of items written.
+    """
+    if indent:
+        opening, separator, closing = b"[\n  ", b",\n  ", b"\n]"
+    else:
+        opening, separator, closing = b"[", b",", b"]"
 
-        if len(quality_check) == 1:
-            return response.json()["items"][0]["id"]
+    count = 0
+    for item in items:
+        file.write(separator if count else opening)
+        content = _encode(item, indent)
+        file.write(content.replace(b"\n", b"\n  ") if indent else content)
+        count += 1
+    file.write(closing if count else b"[]")
+    return count
 
-    return None
 
+def _write_json_lines(items, file) -> int:
+    """
+    Writes items to the binary `file` as JSON Lines, one compact item per line.
 
-def get_check_templates(
+    Returns the number of items written.
+    """
+    count = 0
+    for item in items:
+        file.write(_encode(item))
+        file.write(b"\n")
+        count += 1
+    return count
+
+
+def _read_json_items(file_path: str):
+    """
+    Loads a JSON file, or a JSON Lines file when its content doesn't start
+    with `[`, skipping blank lines.
+    """
+    with open(file_path, "rb") as f:
+        content = f.read()
+    if content.lstrip()[:1] == b"[":
+        return orjson.loads(content)
+    return [orjson.loads(line) for line in content.splitlines() if line.strip()]
+
+
+def iter_quality_checks(
     base_url: str,
     token: str,
-    ids: list[int] | None,
-    status: bool | None,
-    rules: list[str] | None,
+    datastore_id: int,
+    containers: list[int] | None,
     tags: list[str] | None,
+    status: list[str] | None,
 ):
-    endpoint = "quality-checks"
-    url = f"{base_url}{endpoint}?template_only=true"
+    url = f"{base_url}quality-checks"
 
+    archived = None
+    check_statuses = None
     if status:
-        url += f"&template_locked={status}"
+        statuses = [check_status.lower() for check_status in status]
 
-    if rules:
-        rules_string = "".join(f"&rule_type={rule}" for rule in rules)
-        url += rules_string
+        # Process each status
+        for check_status in statuses:
+            if check_status not in ["active", "draft", "archived"]:
+                print(
+                    f"[bold red] The following status: {check_status} doesn't exist [/bold red]"
+                )
 
-    if tags:
-        tags_string = "".join(f"&tag={tag}" for tag in tags)
-        url += tags_string
-    page = 1
-    size = 100
-    params = {"sort_created": "asc", "size": size, "page": page}
+        # If archived is present, we only use archived=only and skip others
+        if "archived" in statuses:
+            archived = "only"
+        # If only one of active or draft is present, filter by it
+        else:
+            active_or_draft = [
+                check_status
+                for check_status in statuses
+                if check_status in ["active", "draft"]
+            ]
+            if len(active_or_draft) == 1:
+                check_statuses = [active_or_draft[0].capitalize()]
+
+    candidates = (
+        ("datastore", datastore_id),
+        ("container", containers),
+        ("tag", tags),
+        ("archived", archived),
+        ("status", check_statuses),
+        ("sort_created", "asc"),
+    )
+    params = {"size": DEFAULT_PAGE_SIZE, **{k: v for k, v in candidates if v}}
 
-    response = requests.get(
-        url, headers=_get_default_headers(token), params=params, verify=False
+    return _iter_pages(
+        url, token, params, resource="quality checks", prefetch=MAX_CONCURRENCY
     )
 
-    # Check for non-success status codes
-    if response.status_code != 200:
-        typer.secho(
-            f"Failed to retrieve check templates. Server responded with: {response.status_code} - {response.text}. Please verify if your credentials are correct.",
-            fg=typer.colors.RED,
-        )
-        raise typer.Exit(code=1)
 
-    data = response.json()
+def get_quality_checks_index(base_url: str, token: str, datastore_id: int):
+    """
+    Maps the source id of every quality check imported into `datastore_id` to its id.
 
-    # Check if "total" is in the response data
-    if "total" not in data:
+    Checks are matched on the "from quality check id" and "main datastore id"
+    additional metadata written by `checks import`. Source ids that were
+    imported more than once map to None, since there is no single check to sync.
+    """
+    quality_check_key = "from quality check id"
+    datastore_id_key = "main datastore id"
+    params = {"size": DEFAULT_PAGE_SIZE, "datastore": datastore_id}
+
+    index = {}
+    for quality_check in _iter_pages(
+        f"{base_url}quality-checks",
+        token,
+        params,
+        "quality checks",
+        prefetch=MAX_CONCURRENCY,
+    ):
+        additional_metadata = quality_check["additional_metadata"] or {}
+        source_id = additional_metadata.get(quality_check_key)
+        if (
+            source_id is None
+            or additional_metadata.get(datastore_id_key) != f"{datastore_id}"
+        ):
+            continue
+        index[source_id] = None if source_id in index else quality_check["id"]
+    return index
+
+
+def _get_check_template(base_url: str, token: str, template_id: int):
+    """Returns the quality check `template_id`, or None if it doesn't exist."""
+    try:
+        with _PAGE_REQUESTS:
+            response = get_session(token).get(f"{base_url}quality-checks/{template_id}")
+    except requests.exceptions.SSLError as e:
+        _exit_on_certificate_error(e)
+
+    if response.status_code == 404:
+        return None
+    if response.status_code != 200:
         typer.secho(
-            f"Unexpected server response. 'total' field missing in: {data}. Please verify if your credentials are correct.",
+            f"Failed to retrieve check template {template_id}. Server responded with: {response.status_code} - {_error_details(response)}.",
             fg=typer.colors.RED,
         )
         raise typer.Exit(code=1)
+    return _decode(response)
 
-    total = data["total"]
-    all_quality_checks = []
-
-    total_pages = -(-total // size)
-
-    # Loop through the pages based on total number and size
-    for current_page in track(
-        range(total_pages), description="Exporting quality checks..."
-    ):
-        # Append the current page's data to the concatenated array
-        all_quality_checks.extend(data["items"])
 
-        total -= size
-        page += 1
-
-        params["page"] = page
-        response = requests.get(
-            url, headers=_get_default_headers(token), params=params, verify=False
+def get_check_templates(
+    base_url: str,
+    token: str,
+    ids: list[int] | None,
+    status: bool | None,
+    rules: list[str] | None,
+    tags: list[str] | None,
+):
+    url = f"{base_url}quality-checks"
+
+    candidates = (
+        ("template_only", "true"),
+        ("template_locked", status),
+        ("rule_type", rules),
+        ("tag", tags),
+        ("sort_created", "asc"),
+    )
+    params = {"size": DEFAULT_PAGE_SIZE, **{k: v for k, v in candidates if v}}
+
+    if ids and not (status or rules or tags):
+        # Only the given templates are wanted, fetch them directly instead of
+        # paging through every template
+        check_templates = _map_unordered(
+            _get_check_template,
+            ((base_url, token, template_id) for template_id in set(ids)),
+            max_workers=MAX_CONCURRENCY,
+        )
+        return sorted(
+            (
+                check_template
+                for check_template in check_templates
+                if check_template is not None
+                and check_template.get("template_only", True)
+            ),
+            key=itemgetter("id"),
         )
-        data = response.json()
+
+    all_quality_checks = _fetch_all_pages(
+        url,
+        token,
+        params,
+        resource="check templates",
+        description="Exporting quality checks...",
+    )
 
     if ids:
+        ids = set(ids)
         all_quality_checks = [
             check for check in all_quality_checks if check["id"] in ids
         ]
@@ -327,14 +786,12 @@ def get_table_ids(
 ):
     for attempt in range(max_retries):
         try:
-            response = requests.get(
+            response = get_session(token).get(
                 base_url + f"containers/listing?datastore={datastore_id}",
-                headers=_get_default_headers(token),
-                verify=False,
             )
 
             if response.status_code == 200:
-                items_array = response.json()
+                items_array = _decode(response)
                 table_ids = {}
                 for item in items_array:
                     table_ids[item["name"]] = item["id"]
@@ -342,13 +799,16 @@ def get_table_ids(
                 return table_ids
             else:
                 typer.secho(
-                    f"Attempt {attempt + 1} failed with status code {response.status_code} - {response.text}. Retrying...",
+                    f"Attempt {attempt + 1} failed with status code {response.status_code} - {_error_details(response)}. Retrying...",
                     fg=typer.colors.RED,
                 )
                 if attempt < max_retries - 1:  # Only sleep if it's not the last attempt
                     time.sleep(
                         retry_delay
                     )  # Wait for a specified delay before retrying
+        except requests.exceptions.SSLError as e:
+            # Retrying can't fix an untrusted certificate
+            _exit_on_certificate_error(e)
         except requests.RequestException as e:
             typer.secho(
                 f"Request error during attempt {attempt + 1}: {e}. Retrying...",
@@ -369,68 +829,54 @@ def get_check_templates_metadata(
     token: str,
     ids: list[int] | None,
 ):
-    endpoint = "quality-checks"
-    url = f"{base_url}{endpoint}?template_only=true"
-
-    page = 1
-    size = 100
-    params = {"sort_created": "asc", "size": size, "page": page}
-
-    response = requests.get(
-        url, headers=_get_default_headers(token), params=params, verify=False
-    )
-
-    # Check for non-success status codes
-    if response.status_code != 200:
-        typer.secho(
-            f"Failed to retrieve check templates. Server responded with: {response.status_code} - {response.text}. Please verify if your credentials are correct.",
-            fg=typer.colors.RED,
-        )
-        raise typer.Exit(code=1)
+    url = f"{base_url}quality-checks"
+    params = {
+        "template_only": "true",
+        "sort_created": "asc",
+        "size": DEFAULT_PAGE_SIZE,
+    }
 
-    data = response.json()
+    check_templates = _iter_pages(url, token, params, resource="check templates")
 
-    # Check if "total" is in the response data
-    if "total" not in data:
-        typer.secho(
-            f"Unexpected server response. 'total' field missing in: {data}. Please verify if your credentials are correct.",
-            fg=typer.colors.RED,
-        )
-        raise typer.Exit(code=1)
+    if not ids:
+        return list(check_templates)
 
-    total = data["total"]
+    # Stop paginating as soon as every requested template has been found
+    remaining_ids = set(ids)
     all_quality_checks = []
+    for check in check_templates:
+        if check["id"] in remaining_ids:
+            all_quality_checks.append(check)
+            remaining_ids.discard(check["id"])
+            if not remaining_ids:
+                break
 
-    total_pages = -(-total // size)
-
-    # Loop through the pages based on total number and size
-    for current_page in range(total_pages):
-        # Append the current page's data to the concatenated array
-        all_quality_checks.extend(data["items"])
-
-        total -= size
-        page += 1
+    return all_quality_checks
 
-        params["page"] = page
-        response = requests.get(
-            url, headers=_get_default_headers(token), params=params, verify=False
-        )
-        data = response.json()
 
-    if ids:
-        all_quality_checks = [
-            check for check in all_quality_checks if check["id"] in ids
-        ]
+def _decode_token_claims(token: str) -> dict:
+    """
+    Returns the claims of a JWT without verifying its signature.
 
-    return all_quality_checks
+    Raises ValueError explaining why `token` isn't a JWT.
+    """
+    segments = token.split(".")
+    if len(segments) != 3:
+        raise ValueError("token is not a JWT, it must have 3 dot-separated segments")
+    payload = segments[1] + "=" * (-len(segments[1]) % 4)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except ValueError:
+        raise ValueError("token payload is not base64url-encoded JSON") from None
+    if not isinstance(claims, dict):
+        raise ValueError("token payload is not a JSON object")
+    return claims
 
 
 def is_token_valid(token: str):
     # Decode the JWT token
     try:
-        decoded_token = jwt.decode(
-            token, algorithms=["none"], options={"verify_signature": False}
-        )
+        decoded_token = _decode_token_claims(token)
         expiration_time = decoded_token.get("exp")
 
         if expiration_time is not None:
@@ -456,14 +902,13 @@ def run_catalog(
     background: bool,
 ):
     config = load_config()
-    base_url = base_url = validate_and_format_url(config["url"])
+    base_url = validate_and_format_url(config["url"])
     endpoint = "operations/run"
     url = f"{base_url}{endpoint}"
     for datastore_id in track(datastore_ids, description="Processing..."):
         try:
-            response = requests.post(
+            response = get_session(token).post(
                 f"{url}",
-                headers=_get_default_headers(token),
                 json={
                     "datastore_id": datastore_id,
                     "type": "catalog",
@@ -475,15 +920,15 @@ def run_catalog(
             if not (
                 200 <= response.status_code <= 299
             ):  # Operation fails before starting
-                response = response.json()
+                response = _decode(response)
                 raise Exception
-            catalog_id = response.json()["id"]
+            catalog_id = _decode(response)["id"]
             print(
                 f"[bold green] Started Catalog operation {catalog_id} "
                 f"for datastore: {datastore_id} [/bold green]"
             )
             if background is False:
-                response = wait_for_operation_finishes(response.json()["id"], token)
+                response = wait_for_operation_finishes(catalog_id, token, base_url)
                 if response["result"] == "success" and response["message"] is None:
                     print(
                         f"[bold green] Successfully Finished Catalog operation {catalog_id}"
@@ -506,6 +951,14 @@ def run_catalog(
                     current_datetime = datetime.now().strftime("[%m-%d-%Y %H:%M:%S]")
                     message = f"{current_datetime}: Error executing catalog operation: {message}\n\n"
                     log_error(message, OPERATION_ERROR_PATH)
+        except requests.RequestException as e:
+            print(
+                f"[bold red] Failed Catalog for datastore: {datastore_id}, Please check the path: "
+                f"{OPERATION_ERROR_PATH}[/bold red]"
+            )
+            current_datetime = datetime.now().strftime("[%m-%d-%Y %H:%M:%S]")
+            message = f"{current_datetime}: Error executing catalog operation: {e}\n\n"
+            log_error(message, OPERATION_ERROR_PATH)
         except Exception:
             print(
                 f"[bold red] Failed Catalog for datastore: {datastore_id}, Please check the path: "
@@ -536,15 +989,14 @@ def run_profile(
     background: bool,
 ):
     config = load_config()
-    base_url = base_url = validate_and_format_url(config["url"])
+    base_url = validate_and_format_url(config["url"])
     endpoint = "operations/run"
     url = f"{base_url}{endpoint}"
 
     for datastore_id in track(datastore_ids, description="Processing..."):
         try:
-            response = requests.post(
+            response = get_session(token).post(
                 f"{url}",
-                headers=_get_default_headers(token),
                 json={
                     "datastore_id": datastore_id,
                     "type": "profile",
@@ -564,14 +1016,14 @@ def run_profile(
             if not (
                 200 <= response.status_code <= 299
             ):  # Operation fails before starting
-                response = response.json()
+                response = _decode(response)
                 raise Exception
-            profile_id = response.json()["id"]
+            profile_id = _decode(response)["id"]
             print(
                 f"[bold green] Successfully Started Profile {profile_id} for datastore: {datastore_id} [/bold green]"
             )
             if background is False:
-                response = wait_for_operation_finishes(response.json()["id"], token)
+                response = wait_for_operation_finishes(profile_id, token, base_url)
                 if response["result"] == "success" and response["message"] is None:
                     print(
                         f"[bold green] Successfully Finished Profile operation {profile_id} "
@@ -594,6 +1046,14 @@ def run_profile(
                     current_datetime = datetime.now().strftime("[%m-%d-%Y %H:%M:%S]")
                     message = f"{current_datetime}: Error executing profile operation: {message}\n\n"
                     log_error(message, OPERATION_ERROR_PATH)
+        except requests.RequestException as e:
+            print(
+                f"[bold red] Failed Profile for datastore: {datastore_id}, Please check the path: "
+                f"{OPERATION_ERROR_PATH}[/bold red]"
+            )
+            current_datetime = datetime.now().strftime("[%m-%d-%Y %H:%M:%S]")
+            message = f"{current_datetime}: Error executing profile operation: {e}\n\n"
+            log_error(message, OPERATION_ERROR_PATH)
         except Exception:
             print(
                 f"[bold red] Failed Profile for datastore: {datastore_id}, Please check the path: "
@@ -621,14 +1081,13 @@ def run_scan(
     background: bool,
 ):
     config = load_config()
-    base_url = base_url = validate_and_format_url(config["url"])
+    base_url = validate_and_format_url(config["url"])
     endpoint = "operations/run"
     url = f"{base_url}{endpoint}"
     for datastore_id in track(datastore_ids, description="Processing..."):
         try:
-            response = requests.post(
+            response = get_session(token).post(
                 f"{url}",
-                headers=_get_default_headers(token),
                 json={
                     "datastore_id": datastore_id,
                     "type": "scan",
@@ -645,14 +1104,14 @@ def run_scan(
             if not (
                 200 <= response.status_code <= 299
             ):  # Operation fails before starting
-                response = response.json()
+                response = _decode(response)
                 raise Exception
-            scan_id = response.json()["id"]
+            scan_id = _decode(response)["id"]
             print(
                 f"[bold green] Successfully Started Scan {scan_id} for datastore: {datastore_id} [/bold green]"
             )
             if background is False:
-                response = wait_for_operation_finishes(response.json()["id"], token)
+                response = wait_for_operation_finishes(scan_id, token, base_url)
                 if response["result"] == "success" and response["message"] is None:
                     print(
                         f"[bold green] Successfully Finished Scan operation {scan_id} "
@@ -679,6 +1138,16 @@ def run_scan(
                         error_file.write(
                             f"{current_datetime} : Error executing catalog operation: {message}\n\n"
                         )
+        except requests.RequestException as e:
+            print(
+                f"[bold red] Failed Scan for datastore: {datastore_id}, Please check the path: "
+                f"{OPERATION_ERROR_PATH}[/bold red]"
+            )
+            with open(OPERATION_ERROR_PATH, "a") as error_file:
+                current_datetime = datetime.now().strftime("[%m-%d-%Y %H:%M:%S]")
+                error_file.write(
+                    f"{current_datetime} : Error executing scan operation: {e}\n\n"
+                )
         except Exception:
             print(
                 f"[bold red] Failed Scan for datastore: {datastore_id}, Please check the path: "
@@ -692,20 +1161,20 @@ def run_scan(
                 )
 
 
-def wait_for_operation_finishes(operation: int, token: str):
+def wait_for_operation_finishes(operation: int, token: str, base_url: str):
     """
     Wait for an operation to finish executing.
 
     Parameters:
     - operation (int): The operation ID.
-    - headers (dict): Optional headers to pass to the requests request.
+    - token (str): The API token used to authenticate the requests.
+    - base_url (str): The formatted API base URL.
 
     Returns:
     - The operation response object.
     """
-    config = load_config()
-    base_url = base_url = validate_and_format_url(config["url"])
-    headers = _get_default_headers(token)
+    session = get_session(token)
+    url = f"{base_url}operations/{operation}"
     max_retries = 10
     wait_time = 50
     for attempt in range(max_retries):
@@ -713,9 +1182,7 @@ def wait_for_operation_finishes(operation: int, token: str):
         response = None
         while not end_scan:
             print(" Waiting for operation to finish")
-            response = requests.get(
-                base_url + f"operations/{operation}", headers=headers
-            ).json()
+            response = _decode(session.get(url))
             time.sleep(5)
             if response["end_time"]:
                 end_scan = True
@@ -730,13 +1197,10 @@ def wait_for_operation_finishes(operation: int, token: str):
 
 def check_operation_status(operation_ids: [int], token: str):
     config = load_config()
-    base_url = base_url = validate_and_format_url(config["url"])
-    headers = _get_default_headers(token)
+    base_url = validate_and_format_url(config["url"])
 
     for curr_id in track(operation_ids, description="Processing..."):
-        response = requests.get(
-            base_url + f"operations/{curr_id}", headers=headers
-        ).json()
+        response = _decode(get_session(token).get(base_url + f"operations/{curr_id}"))
         if "result" not in response.keys():
             print(f"[bold red] Operation: {curr_id} Not Found")
         elif response["result"] == "success":
@@ -797,6 +1261,7 @@ def init(
 
     if token_valid:
         save_config(config)
+        reset_session_cache()
         print("[bold green] Configuration saved! [/bold green]")
 
 
@@ -821,6 +1286,16 @@ def checks_export(
     output: str = typer.Option(
         BASE_PATH + "/data_checks.json", "--output", help="Output file path"
     ),
+    compact: bool = typer.Option(
+        False,
+        "--compact",
+        help="Write the file without indentation, which is smaller and faster to write",
+    ),
+    jsonl: bool = typer.Option(
+        False,
+        "--jsonl",
+        help="Write one check per line (JSON Lines) instead of a JSON array",
+    ),
 ):
     """
     Export checks to a file.
@@ -831,13 +1306,13 @@ def checks_export(
 
     if token:
         if containers:
-            containers = [int(x.strip()) for x in containers.strip("[]").split(",")]
+            containers = _parse_int_list(containers)
         if tags:
-            tags = [str(x.strip()) for x in tags.strip("[]").split(",")]
+            tags = _parse_comma_list(tags)
         if status:
-            status = [str(x.strip()) for x in status.strip("[]").split(",")]
+            status = _parse_comma_list(status)
 
-        all_quality_checks = get_quality_checks(
+        quality_checks = iter_quality_checks(
             base_url=base_url,
             token=token,
             datastore_id=datastore,
@@ -846,8 +1321,19 @@ def checks_export(
             status=status,
         )
 
-        with open(output, "w") as f:
-            json.dump(all_quality_checks, f, indent=4)
+        # Checks are written as their pages arrive instead of being buffered,
+        # the output is only replaced once every page was written
+        with _replace_file(output) as f:
+            quality_checks = track(
+                quality_checks,
+                total=quality_checks.total,
+                description="Exporting quality checks...",
+            )
+            if jsonl:
+                total = _write_json_lines(quality_checks, f)
+            else:
+                total = _write_json_array(quality_checks, f, indent=not compact)
+        print(f"[bold green] Total of Quality Checks = {total} [/bold green]")
         print(f"[bold green]Data exported to {output}[/bold green]")
 
 
@@ -879,6 +1365,11 @@ def check_templates_export(
     output: str = typer.Option(
         BASE_PATH + "/data_checks_template.json", "--output", help="Output file path"
     ),
+    compact: bool = typer.Option(
+        False,
+        "--compact",
+        help="Write the file without indentation, which is smaller and faster to write",
+    ),
 ):
     """
     Export check templates to an enrichment or file.
@@ -889,9 +1380,7 @@ def check_templates_export(
 
     if token:
         if check_templates:
-            check_templates = [
-                int(x.strip()) for x in check_templates.strip("[]").split(",")
-            ]
+            check_templates = _parse_int_list(check_templates)
         if enrich_datastore_id:
             endpoint = "export/check-templates"
             url = f"{base_url}{endpoint}?enrich_datastore_id={enrich_datastore_id}"
@@ -903,14 +1392,12 @@ def check_templates_export(
                 )
                 url += containers_string
 
-            response = requests.post(
-                url, headers=_get_default_headers(token), verify=False
-            )
+            response = get_session(token).post(url)
 
             # Check for non-success status codes
             if response.status_code != 204:
                 typer.secho(
-                    f"Failed to export check templates. Server responded with: {response.status_code} - {response.text}.",
+                    f"Failed to export check templates. Server responded with: {response.status_code} - {_error_details(response)}.",
                     fg=typer.colors.RED,
                 )
                 raise typer.Exit(code=1)
@@ -920,7 +1407,9 @@ def check_templates_export(
             )
         else:
             if rules:
-                rules = [str(x.strip()) for x in rules.strip("[]").split(",")]
+                rules = _parse_comma_list(rules)
+            if tags:
+                tags = _parse_comma_list(tags)
 
             all_quality_checks = get_check_templates(
                 base_url=base_url,
@@ -939,11 +1428,311 @@ def check_templates_export(
                 print(
                     f"[bold green] Total of Check Templates exported= {len(all_quality_checks)} [/bold green]"
                 )
-                with open(output, "w") as f:
-                    json.dump(all_quality_checks, f, indent=4)
+                with open(output, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                    f.write(_encode(all_quality_checks, indent=not compact))
                 print(f"[bold green]Data exported to {output}[/bold green]")
 
 
+def _get_conflict_id(response: requests.Response):
+    """
+    Returns the id of the existing quality check a 409 Conflict response refers to.
+
+    Returns None for any other response, or when the id can't be found in it.
+    """
+    if response.status_code != 409:
+        return None
+    match = _CONFLICT_ID_RE.search(response.text)
+    return match.group(1) if match else None
+
+
+def _read_import_file(input_file: str, resource: str) -> list:
+    """
+    Reads the exported `resource` to import from `input_file`.
+
+    Called before any request is made, so a missing or malformed file fails
+    fast and an empty one exits without contacting the API. Both JSON arrays
+    and JSON Lines, as written by `checks export --jsonl`, are accepted.
+    """
+    try:
+        items = _read_json_items(input_file)
+    except (OSError, ValueError) as e:
+        typer.secho(
+            f"Failed to read the {resource} from {input_file}: {e}",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(code=1)
+
+    if not isinstance(items, list):
+        typer.secho(
+            f"The file {input_file} must contain a list of {resource}.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(code=1)
+
+    if not items:
+        print(f"[bold yellow]No {resource} found in {input_file}[/bold yellow]")
+        raise typer.Exit()
+
+    return items
+
+
+def _get_check_payload(quality_check: dict) -> dict:
+    """
+    Builds the part of the import payload of `quality_check` shared by every datastore.
+    """
+    (
+        description,
+        rule_type,
+        coverage,
+        is_new,
+        check_filter,
+        properties,
+        status,
+    ) = _quality_check_values(quality_check)
+    return {
+        "fields": list(map(_get_name, quality_check["fields"])),
+        "description": f"{description}",
+        "rule": rule_type,
+        "coverage": coverage,
+        "is_new": is_new,
+        "filter": check_filter,
+        "properties": properties,
+        "tags": list(map(_get_name, quality_check["global_tags"])),
+        "status": status,
+    }
+
+
+def _iter_check_imports(quality_checks: list, datastores: list):
+    """
+    Yields the `(datastore_id, quality_check, check_payload)` to import, check
+    by check, so the payload of each check is only built once.
+    """
+    for quality_check in quality_checks:
+        check_payload = _get_check_payload(quality_check)
+        for datastore_id in datastores:
+            yield datastore_id, quality_check, check_payload
+
+
+def _import_quality_check(
+    base_url: str,
+    token: str,
+    datastore_id: int,
+    quality_check: dict,
+    check_payload: dict,
+    table_ids: dict | None,
+    existing_checks: dict,
+    check_templates_by_id: dict,
+    error_log: _ErrorLog,
+    verbose: bool = False,
+):
+    """
+    Creates or updates `quality_check` on the datastore `datastore_id`.
+
+    `check_payload` is the part of the payload that doesn't depend on the
+    datastore, as returned by _get_check_payload. `table_ids` maps the
+    datastore's container names to their ids, as returned by get_table_ids.
+    `existing_checks` is the index returned by get_quality_checks_index for
+    the datastore, used to find a check imported from `quality_check` before.
+    `check_templates_by_id` holds the templates referenced by the imported
+    checks, keyed by their id. Errors are written to `error_log`, successful
+    creates and updates are only reported when `verbose` is set.
+
+    Returns the number of quality checks created and updated.
+    """
+    created_checks = 0
+    updated_checks = 0
+    container_name = quality_check["container"]["name"]
+    session = get_session(token)
+    checks_url = f"{base_url}quality-checks"
+
+    container_id = None
+    if table_ids:
+        container_id = table_ids.get(container_name)
+        if container_id is None:
+            print(
+                f"[bold red] Profile `{container_name}` was not found in datastore id: {datastore_id}[/bold red]"
+            )
+            error_log.log(
+                f"Profile `{container_name}` of quality check {quality_check['id']} was not found in datastore id: {datastore_id}"
+            )
+        if container_id:
+            try:
+                additional_metadata = {
+                    "from quality check id": f"{quality_check['id']}",
+                    "main datastore id": f"{datastore_id}",
+                }
+
+                # Checks are shared between datastores processed in parallel,
+                # so build a new metadata dict instead of updating the original
+                check_metadata = {
+                    **(quality_check["additional_metadata"] or {}),
+                    **additional_metadata,
+                }
+
+                payload = {
+                    **check_payload,
+                    "container_id": container_id,
+                    "additional_metadata": check_metadata,
+                }
+                # gets the quality_check previously imported from this one
+                quality_check_id = existing_checks.get(f"{quality_check['id']}")
+
+                # If a quality check contains the description, we sync
+                if quality_check_id:
+                    if verbose:
+                        print(
+                            f"[bold yellow]Quality check for container: {container_name} was already created on datastore id: {datastore_id}. Updating quality check id: {quality_check_id}[/bold yellow]"
+                        )
+                    response = session.put(
+                        f"{checks_url}/{quality_check_id}",
+                        data=_encode(payload),
+                        headers=JSON_HEADERS,
+                    )
+                    if response.status_code == 200:
+                        if verbose:
+                            print(
+                                f"[bold green]Quality check id: {quality_check_id} updated successfully for datastore id: {datastore_id}[/bold green]"
+                            )
+                        updated_checks += 1
+                    else:
+                        print(
+                            f"[bold red]Error updating quality check id: {quality_check_id} [/bold red]"
+                        )
+                        error_log.log(
+                            f"Error updating quality check id: {quality_check_id} on datastore id: {datastore_id}. Details: {_error_details(response)}"
+                        )
+                # If a quality check does not contain the description:
+                # 1. We try to create quality check and verify for conflict
+                #    a. If we notify a conflict, it will  update the check
+                #    b. If there's no conflict, it will create a new one
+                else:
+                    new_check_from_template = False
+                    if quality_check["template"] is not None:
+                        template_id = quality_check["template"]["id"]
+                        check_templates = (
+                            [check_templates_by_id[template_id]]
+                            if template_id in check_templates_by_id
+                            else []
+                        )
+                        if len(check_templates) > 0:
+                            for check_template in check_templates:
+                                check_template_payload = {
+                                    "fields": check_payload["fields"],
+                                    "description": f"{check_template['description']}",
+                                    "rule": check_template["rule_type"],
+                                    "coverage": check_template["coverage"],
+                                    "filter": check_template["filter"],
+                                    "properties": check_template["properties"],
+                                    "tags": list(
+                                        map(_get_name, check_template["global_tags"])
+                                    ),
+                                    "container_id": container_id,
+                                    "additional_metadata": check_template[
+                                        "additional_metadata"
+                                    ],
+                                    "template_id": check_template["id"],
+                                    "status": quality_check["status"],
+                                }
+                                response = session.post(
+                                    checks_url,
+                                    data=_encode(check_template_payload),
+                                    headers=JSON_HEADERS,
+                                )
+                                conflict_id = _get_conflict_id(response)
+                                if conflict_id is not None:
+                                    if verbose:
+                                        print(
+                                            f"[bold yellow]Quality check for container: {container_name} was already created on datastore id: {datastore_id}. Updating check id: {conflict_id}.[/bold yellow]"
+                                        )
+                                    response = session.put(
+                                        f"{checks_url}/{conflict_id}",
+                                        data=_encode(check_template_payload),
+                                        headers=JSON_HEADERS,
+                                    )
+                                    if response.status_code == 200:
+                                        if verbose:
+                                            print(
+                                                f"[bold green]Quality check id: {conflict_id} updated successfully for datastore id: {datastore_id} from the template: '{check_template['id']}'[/bold green]"
+                                            )
+                                        updated_checks += 1
+                                    else:
+                                        print(
+                                            f"[bold red]Error updating quality check id: {conflict_id} from the template: '{check_template['id']}' [/bold red]"
+                                        )
+                                        error_log.log(
+                                            f"Error updating quality check id: {conflict_id} on datastore id: {datastore_id} from the template: '{check_template['id']}'. Details: {_error_details(response)}"
+                                        )
+                                elif response.status_code == 200:
+                                    if verbose:
+                                        print(
+                                            f"[bold green]Quality check id: {_decode(response)['id']} for container: {container_name} created successfully from the template: '{check_template['id']}'[/bold green]"
+                                        )
+                                    created_checks += 1
+                                elif response.status_code == 404:
+                                    print(
+                                        f"[bold yellow]Error creating quality check id: {quality_check['id']} from the template: '{check_template['id']}'. Creating check without a template [/bold yellow]"
+                                    )
+                                    new_check_from_template = True
+                                else:
+                                    error_log.log(
+                                        f"Error creating quality check for datastore id: {datastore_id}. Details: {_error_details(response)} from the template: '{check_template['id']}"
+                                    )
+                        else:
+                            print(
+                                f"[bold yellow]Error creating quality check id: {quality_check['id']} from the template: '{quality_check['template']['id']}'. Attempt to create the check without a template [/bold yellow]"
+                            )
+                            new_check_from_template = True
+                    if new_check_from_template or quality_check["template"] is None:
+                        response = session.post(
+                            checks_url,
+                            data=_encode(payload),
+                            headers=JSON_HEADERS,
+                        )
+                        conflict_id = _get_conflict_id(response)
+                        if conflict_id is not None:
+                            if verbose:
+                                print(
+                                    f"[bold yellow]Quality check for container: {container_name} was already created on datastore id: {datastore_id}. Updating check id: {conflict_id}.[/bold yellow]"
+                                )
+                            response = session.put(
+                                f"{checks_url}/{conflict_id}",
+                                data=_encode(payload),
+                                headers=JSON_HEADERS,
+                            )
+                            if response.status_code == 200:
+                                if verbose:
+                                    print(
+                                        f"[bold green]Quality check id: {conflict_id} updated successfully for datastore id: {datastore_id}[/bold green]"
+                                    )
+                                updated_checks += 1
+                            else:
+                                print(
+                                    f"[bold red]Error updating quality check id: {conflict_id} [/bold red]"
+                                )
+                                error_log.log(
+                                    f"Error updating quality check id: {conflict_id} on datastore id: {datastore_id}. Details: {_error_details(response)}"
+                                )
+                        elif response.status_code == 200:
+                            if verbose:
+                                print(
+                                    f"[bold green]Quality check id: {_decode(response)['id']} for container: {container_name} created successfully[/bold green]"
+                                )
+                            created_checks += 1
+                        else:
+                            error_log.log(
+                                f"Error creating quality check for datastore id: {datastore_id}. Details: {_error_details(response)}"
+                            )
+            except requests.RequestException as e:
+                print(
+                    f"[bold red]Error importing quality check {quality_check['id']} to datastore id: {datastore_id}: {e}[/bold red]"
+                )
+                error_log.log(
+                    f"Error importing quality check {quality_check['id']} to datastore id: {datastore_id}. Details: {e}"
+                )
+
+    return created_checks, updated_checks
+
+
 @checks_app.command("import")
 def checks_import(
     datastore: str = typer.Option(
@@ -954,247 +1743,184 @@ def checks_import(
     input_file: str = typer.Option(
         BASE_PATH + "/data_checks.json", "--input", help="Input file path"
     ),
+    concurrency: int = typer.Option(
+        MAX_CONCURRENCY,
+        "--concurrency",
+        min=1,
+        max=POOL_SIZE,
+        help="Number of quality checks imported in parallel",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        help="Report every quality check created or updated, not only errors",
+    ),
 ):
     """
     Import checks from a file.
     """
     # Remove brackets if present and split by comma
-    datastores = [int(x.strip()) for x in datastore.strip("[]").split(",")]
+    datastores = _parse_int_list(datastore)
+    all_quality_checks = _read_import_file(input_file, "quality checks")
     config = load_config()
     base_url = validate_and_format_url(config["url"])
     token = is_token_valid(config["token"])
-    error_log_path = f"/errors-{datetime.now().strftime('%Y-%m-%d')}.log"
+    error_log_path = f"{BASE_PATH}/errors-{datetime.now().strftime('%Y-%m-%d')}.log"
     if token:
-        with open(input_file, "r") as f:
-            all_quality_checks = json.load(f)
-            total_created_checks = 0
-            total_updated_checks = 0
-
-            # Create pairs of datastore and quality_check to process
-            pairs_to_process = list(product(datastores, all_quality_checks))
+        total_created_checks = 0
+        total_updated_checks = 0
+
+        # Look up the containers and the checks imported by earlier runs
+        # once per datastore instead of once per check, for every datastore
+        # at the same time. The templates the checks refer to are fetched
+        # together in a single lookup.
+        template_ids = sorted(
+            {
+                quality_check["template"]["id"]
+                for quality_check in all_quality_checks
+                if quality_check["template"] is not None
+            }
+        )
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending_check_templates = (
+                executor.submit(
+                    get_check_templates_metadata,
+                    base_url=base_url,
+                    token=token,
+                    ids=template_ids,
+                )
+                if template_ids
+                else None
+            )
+            pending_table_ids = {
+                datastore_id: executor.submit(
+                    get_table_ids,
+                    base_url=base_url,
+                    token=token,
+                    datastore_id=datastore_id,
+                )
+                for datastore_id in datastores
+            }
+            pending_existing_checks = {
+                datastore_id: executor.submit(
+                    get_quality_checks_index, base_url, token, datastore_id
+                )
+                for datastore_id in datastores
+            }
+            table_ids = {
+                datastore_id: future.result()
+                for datastore_id, future in pending_table_ids.items()
+            }
+            existing_checks = {
+                datastore_id: future.result()
+                for datastore_id, future in pending_existing_checks.items()
+            }
+            check_templates_by_id = (
+                {
+                    check_template["id"]: check_template
+                    for check_template in pending_check_templates.result()
+                }
+                if pending_check_templates is not None
+                else {}
+            )
 
+        with _ErrorLog(error_log_path) as error_log:
+            # Pairs of datastore and quality_check are generated as workers free up
+            pairs_to_process = _iter_check_imports(all_quality_checks, datastores)
+            results = _map_unordered(
+                _import_quality_check,
+                (
+                    (
+                        base_url,
+                        token,
+                        datastore_id,
+                        quality_check,
+                        check_payload,
+                        table_ids[datastore_id],
+                        existing_checks[datastore_id],
+                        check_templates_by_id,
+                        error_log,
+                        verbose,
+                    )
+                    for datastore_id, quality_check, check_payload in pairs_to_process
+                ),
+                max_workers=concurrency,
+            )
             # Now use the track function to show the progress bar
-            for datastore_id, quality_check in track(
-                pairs_to_process, description="Processing..."
+            for created_checks, updated_checks in track(
+                results,
+                total=len(datastores) * len(all_quality_checks),
+                description="Processing...",
             ):
-                # for datastore_id in datastores:
-                table_ids = get_table_ids(
-                    base_url=base_url, token=token, datastore_id=datastore_id
-                )
+                total_created_checks += created_checks
+                total_updated_checks += updated_checks
 
-                # for quality_check in all_quality_checks:
-                container_id = None
-                if table_ids:
-                    try:
-                        container_id = table_ids[quality_check["container"]["name"]]
-                    except Exception:
-                        print(
-                            f"[bold red] Profile `{quality_check['container']['name']}` was not found in datastore id: {datastore_id}[/bold red]"
-                        )
-                        log_error(
-                            f"Profile `{quality_check['container']['name']}` of quality check {quality_check['id']} was not found in datastore id: {datastore_id}",
-                            BASE_PATH + error_log_path,
-                        )
-                    if container_id:
-                        additional_metadata = {
-                            "from quality check id": f"{quality_check['id']}",
-                            "main datastore id": f"{datastore_id}",
-                        }
-
-                        if quality_check["additional_metadata"] is None:
-                            quality_check["additional_metadata"] = additional_metadata
-                        else:
-                            quality_check["additional_metadata"].update(
-                                additional_metadata
-                            )
+        print(f"Updated a total of {total_updated_checks} quality checks.")
+        print(f"Created a total of {total_created_checks} quality checks.")
 
-                        payload = {
-                            "fields": [
-                                field["name"] for field in quality_check["fields"]
-                            ],
-                            "description": f"{quality_check['description']}",
-                            "rule": quality_check["rule_type"],
-                            "coverage": quality_check["coverage"],
-                            "is_new": quality_check["is_new"],
-                            "filter": quality_check["filter"],
-                            "properties": quality_check["properties"],
-                            "tags": [
-                                global_tag["name"]
-                                for global_tag in quality_check["global_tags"]
-                            ],
-                            "container_id": container_id,
-                            "additional_metadata": quality_check["additional_metadata"],
-                            "status": quality_check["status"],
-                        }
-                        # gets the quality_check by the description
-                        quality_check_id = get_quality_check_by_additional_metadata(
-                            base_url=base_url,
-                            token=token,
-                            additional_metadata=additional_metadata,
-                        )
 
-                        # If a quality check contains the description, we sync
-                        if quality_check_id:
-                            print(
-                                f"[bold yellow]Quality check for container: {quality_check['container']['name']} was already created on datastore id: {datastore_id}. Updating quality check id: {quality_check_id}[/bold yellow]"
-                            )
-                            response = requests.put(
-                                base_url + f"quality-checks/{quality_check_id}",
-                                headers=_get_default_headers(token),
-                                json=payload,
-                                verify=False,
-                            )
-                            if response.status_code == 200:
-                                print(
-                                    f"[bold green]Quality check id: {quality_check_id} updated successfully for datastore id: {datastore_id}[/bold green]"
-                                )
-                                total_updated_checks += 1
-                            else:
-                                print(
-                                    f"[bold red]Error updating quality check id: {quality_check_id} [/bold red]"
-                                )
-                                log_error(
-                                    f"Error updating quality check id: {quality_check_id} on datastore id: {datastore_id}. Details: {response.text}",
-                                    BASE_PATH + error_log_path,
-                                )
-                        # If a quality check does not contain the description:
-                        # 1. We try to create quality check and verify for conflict
-                        #    a. If we notify a conflict, it will  update the check
-                        #    b. If there's no conflict, it will create a new one
-                        else:
-                            new_check_from_template = False
-                            if quality_check["template"] is not None:
-                                check_templates = get_check_templates_metadata(
-                                    base_url=base_url,
-                                    token=token,
-                                    ids=[quality_check["template"]["id"]],
-                                )
-                                if len(check_templates) > 0:
-                                    for check_template in check_templates:
-                                        check_template_payload = {
-                                            "fields": [
-                                                field["name"]
-                                                for field in quality_check["fields"]
-                                            ],
-                                            "description": f"{check_template['description']}",
-                                            "rule": check_template["rule_type"],
-                                            "coverage": check_template["coverage"],
-                                            "filter": check_template["filter"],
-                                            "properties": check_template["properties"],
-                                            "tags": [
-                                                global_tag["name"]
-                                                for global_tag in check_template[
-                                                    "global_tags"
-                                                ]
-                                            ],
-                                            "container_id": container_id,
-                                            "additional_metadata": check_template[
-                                                "additional_metadata"
-                                            ],
-                                            "template_id": check_template["id"],
-                                            "status": quality_check["status"],
-                                        }
-                                        response = requests.post(
-                                            base_url + "quality-checks",
-                                            headers=_get_default_headers(token),
-                                            json=check_template_payload,
-                                            verify=False,
-                                        )
-                                        if response.status_code == 409:
-                                            match = re.search(
-                                                r"id: (\d+)", response.text
-                                            )
-                                            print(
-                                                f"[bold yellow]Quality check for container: {quality_check['container']['name']} was already created on datastore id: {datastore_id}. Updating check id: {match.group(1)}.[/bold yellow]"
-                                            )
-                                            response = requests.put(
-                                                base_url
-                                                + f"quality-checks/{match.group(1)}",
-                                                headers=_get_default_headers(token),
-                                                json=check_template_payload,
-                                                verify=False,
-                                            )
-                                            if response.status_code == 200:
-                                                print(
-                                                    f"[bold green]Quality check id: {match.group(1)} updated successfully for datastore id: {datastore_id} from the template: '{check_template['id']}'[/bold green]"
-                                                )
-                                                total_updated_checks += 1
-                                            else:
-                                                print(
-                                                    f"[bold red]Error updating quality check id: {match.group(1)} from the template: '{check_template['id']}' [/bold red]"
-                                                )
-                                                log_error(
-                                                    f"Error updating quality check id: {match.group(1)} on datastore id: {datastore_id} from the template: '{check_template['id']}'. Details: {response.text}",
-                                                    BASE_PATH + error_log_path,
-                                                )
-                                        elif response.status_code == 200:
-                                            print(
-                                                f"[bold green]Quality check id: {response.json()['id']} for container: {quality_check['container']['name']} created successfully from the template: '{check_template['id']}'[/bold green]"
-                                            )
-                                            total_created_checks += 1
-                                        elif response.status_code == 404:
-                                            print(
-                                                f"[bold yellow]Error creating quality check id: {match.group(1)} from the template: '{check_template['id']}'. Creating check without a template [/bold yellow]"
-                                            )
-                                            new_check_from_template = True
-                                        else:
-                                            log_error(
-                                                f"Error creating quality check for datastore id: {datastore_id}. Details: {response.text} from the template: '{check_template['id']}",
-                                                BASE_PATH + error_log_path,
-                                            )
-                                else:
-                                    print(
-                                        f"[bold yellow]Error creating quality check id: {quality_check['id']} from the template: '{quality_check['template']['id']}'. Attempt to create the check without a template [/bold yellow]"
-                                    )
-                                    new_check_from_template = True
-                            if (
-                                new_check_from_template
-                                or quality_check["template"] is None
-                            ):
-                                response = requests.post(
-                                    base_url + "quality-checks",
-                                    headers=_get_default_headers(token),
-                                    json=payload,
-                                    verify=False,
-                                )
-                                if response.status_code == 409:
-                                    match = re.search(r"id: (\d+)", response.text)
-                                    print(
-                                        f"[bold yellow]Quality check for container: {quality_check['container']['name']} was already created on datastore id: {datastore_id}. Updating check id: {match.group(1)}.[/bold yellow]"
-                                    )
-                                    response = requests.put(
-                                        base_url + f"quality-checks/{match.group(1)}",
-                                        headers=_get_default_headers(token),
-                                        json=payload,
-                                        verify=False,
-                                    )
-                                    if response.status_code == 200:
-                                        print(
-                                            f"[bold green]Quality check id: {match.group(1)} updated successfully for datastore id: {datastore_id}[/bold green]"
-                                        )
-                                        total_updated_checks += 1
-                                    else:
-                                        print(
-                                            f"[bold red]Error updating quality check id: {match.group(1)} [/bold red]"
-                                        )
-                                        log_error(
-                                            f"Error updating quality check id: {match.group(1)} on datastore id: {datastore_id}. Details: {response.text}",
-                                            BASE_PATH + error_log_path,
-                                        )
-                                elif response.status_code == 200:
-                                    print(
-                                        f"[bold green]Quality check id: {response.json()['id']} for container: {quality_check['container']['name']} created successfully[/bold green]"
-                                    )
-                                    total_created_checks += 1
-                                else:
-                                    log_error(
-                                        f"Error creating quality check for datastore id: {datastore_id}. Details: {response.text}",
-                                        BASE_PATH + error_log_path,
-                                    )
+def _import_check_template(
+    base_url: str,
+    token: str,
+    check_template: dict,
+    error_log: _ErrorLog,
+    verbose: bool = False,
+):
+    """
+    Creates a new check template from `check_template`, writing errors to `error_log`.
+
+    Created templates are only reported when `verbose` is set.
+
+    Returns the number of check templates created.
+    """
+    try:
+        additional_metadata = {
+            "from quality check id": f"{check_template.get('id', None)}",
+        }
+
+        if check_template.get("additional_metadata", None) is None:
+            check_template["additional_metadata"] = additional_metadata
+        else:
+            check_template["additional_metadata"].update(additional_metadata)
+
+        # Build the payload for the API request
+        payload = {
+            "fields": list(map(_get_name, check_template["fields"])),
+            "description": check_template["description"],
+            "rule": check_template["rule_type"],
+            "coverage": check_template["coverage"],
+            "properties": check_template["properties"],
+            "tags": list(map(_get_name, check_template["global_tags"])),
+            "template_locked": check_template.get("template_locked", False),
+            "template_only": True,  # Mark as a template
+            "additional_metadata": check_template.get("additional_metadata", None),
+        }
+
+        # Create a new check template via POST request
+        response = get_session(token).post(
+            base_url + "quality-checks",
+            data=_encode(payload),
+            headers=JSON_HEADERS,
+        )
+        if response.status_code == 200:
+            if verbose:
+                print(
+                    f"[bold green]Check template id: {_decode(response)['id']} created successfully[/bold green]"
+                )
+            return 1
 
-            print(f"Updated a total of {total_updated_checks} quality checks.")
-            print(f"Created a total of {total_created_checks} quality checks.")
-            distinct_file_content(BASE_PATH + error_log_path)
+        print("[bold red]Error creating check template [/bold red]")
+        error_log.log(
+            f"Error creating check template. Details: {_error_details(response)}"
+        )
+    except Exception as e:
+        print(
+            f"[bold red]Error processing check template {check_template['id']}: {str(e)}[/bold red]"
+        )
+        error_log.log(
+            f"Error processing check template {check_template['id']}. Details: {str(e)}"
+        )
+    return 0
 
 
 @checks_app.command("import-templates")
@@ -1202,84 +1928,50 @@ def check_templates_import(
     input_file: str = typer.Option(
         BASE_PATH + "/data_checks_template.json", "--input", help="Input file path"
     ),
+    concurrency: int = typer.Option(
+        MAX_CONCURRENCY,
+        "--concurrency",
+        min=1,
+        max=POOL_SIZE,
+        help="Number of check templates imported in parallel",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        help="Report every check template created, not only errors",
+    ),
 ):
     """
     Import check templates from a file. Only creates new templates, no updates.
     """
+    all_check_templates = _read_import_file(input_file, "check templates")
     config = load_config()
     base_url = validate_and_format_url(config["url"])
     token = is_token_valid(config["token"])
-    error_log_path = f"/errors-{datetime.now().strftime('%Y-%m-%d')}.log"
+    error_log_path = f"{BASE_PATH}/errors-{datetime.now().strftime('%Y-%m-%d')}.log"
 
     if token:
-        with open(input_file, "r") as f:
-            all_check_templates = json.load(f)
-            total_created_templates = 0
-
-            # Process each check template from the file
-            for check_template in track(
-                all_check_templates, description="Processing templates..."
+        total_created_templates = 0
+
+        with _ErrorLog(error_log_path) as error_log:
+            # Create the check templates from the file concurrently
+            results = _map_unordered(
+                _import_check_template,
+                (
+                    (base_url, token, check_template, error_log, verbose)
+                    for check_template in all_check_templates
+                ),
+                max_workers=concurrency,
+            )
+            for created_templates in track(
+                results,
+                total=len(all_check_templates),
+                description="Processing templates...",
             ):
-                try:
-                    additional_metadata = {
-                        "from quality check id": f"{check_template.get('id', None)}",
-                    }
-
-                    if check_template.get("additional_metadata", None) is None:
-                        check_template["additional_metadata"] = additional_metadata
-                    else:
-                        check_template["additional_metadata"].update(
-                            additional_metadata
-                        )
+                total_created_templates += created_templates
 
-                    # Build the payload for the API request
-                    payload = {
-                        "fields": [field["name"] for field in check_template["fields"]],
-                        "description": check_template["description"],
-                        "rule": check_template["rule_type"],
-                        "coverage": check_template["coverage"],
-                        "properties": check_template["properties"],
-                        "tags": [
-                            global_tag["name"]
-                            for global_tag in check_template["global_tags"]
-                        ],
-                        "template_locked": check_template.get("template_locked", False),
-                        "template_only": True,  # Mark as a template
-                        "additional_metadata": check_template.get(
-                            "additional_metadata", None
-                        ),
-                    }
-
-                    # Create a new check template via POST request
-                    response = requests.post(
-                        base_url + "quality-checks",
-                        headers=_get_default_headers(token),
-                        json=payload,
-                        verify=False,
-                    )
-                    if response.status_code == 200:
-                        print(
-                            f"[bold green]Check template id: {response.json()['id']} created successfully[/bold green]"
-                        )
-                        total_created_templates += 1
-                    else:
-                        print("[bold red]Error creating check template [/bold red]")
-                        log_error(
-                            f"Error creating check template. Details: {response.text}",
-                            BASE_PATH + error_log_path,
-                        )
-                except Exception as e:
-                    print(
-                        f"[bold red]Error processing check template {check_template['id']}: {str(e)}[/bold red]"
-                    )
-                    log_error(
-                        f"Error processing check template {check_template['id']}. Details: {str(e)}",
-                        BASE_PATH + error_log_path,
-                    )
-
-            # Print summary of created templates
-            print(f"Created a total of {total_created_templates} check templates.")
-            distinct_file_content(BASE_PATH + error_log_path)
+        # Print summary of created templates
+        print(f"Created a total of {total_created_templates} check templates.")
 
 
 @schedule_app.command("export-metadata")
@@ -1301,6 +1993,9 @@ def schedule(
         help="Comma-separated list of op to export or all for everything. Example: anomalies, checks, field-profiles or all",
     ),
 ):
+    # Imported here, croniter and its dependencies are only needed for scheduling
+    from croniter import croniter
+
     # Validate the crontab expression
     try:
         croniter(crontab_expression)
@@ -1310,13 +2005,13 @@ def schedule(
         )
         return
     if containers:
-        containers = [int(x.strip()) for x in containers.strip("[]").split(",")]
+        containers = _parse_int_list(containers)
 
     if "all" in options:
         # If "all" is specified, include all metadata types
         options = ["anomalies", "checks", "field-profiles"]
     elif "," in options:
-        options = [str(x.strip()) for x in options.strip("[]").split(",")]
+        options = _parse_comma_list(options)
     else:
         options = [options]
 
@@ -1441,12 +2136,12 @@ def catalog_operation(
     ),
 ):
     # Remove brackets if present and split by comma
-    datastores = [int(x.strip()) for x in datastores.strip("[]").split(",")]
+    datastores = _parse_int_list(datastores)
     config = load_config()
     token = is_token_valid(config["token"])
     if token:
         if include:
-            include = [(x.strip()) for x in include.strip("[]").split(",")]
+            include = _parse_comma_list(include)
         if prune is None:
             prune = False
         if recreate is None:
@@ -1522,7 +2217,7 @@ def profile_operation(
     ),
 ):
     # Remove brackets if present and split by comma
-    datastores = [int(x.strip()) for x in datastores.strip("[]").split(",")]
+    datastores = _parse_int_list(datastores)
     config = load_config()
     token = is_token_valid(config["token"])
     if token:
@@ -1536,13 +2231,9 @@ def profile_operation(
             )
             exit(1)
         if container_names:
-            container_names = [
-                (x.strip()) for x in container_names.strip("[]").split(",")
-            ]
+            container_names = _parse_comma_list(container_names)
         if container_tags:
-            container_tags = [
-                (x.strip()) for x in container_tags.strip("[]").split(",")
-            ]
+            container_tags = _parse_comma_list(container_tags)
         if greater_than_time:
             greater_than_time = greater_than_time.strftime("%Y-%m-%dT%H:%M:%S.000Z")
 
@@ -1621,7 +2312,7 @@ def scan_operation(
     ),
 ):
     # Remove brackets if present and split by comma
-    datastores = [int(x.strip()) for x in datastores.strip("[]").split(",")]
+    datastores = _parse_int_list(datastores)
     config = load_config()
     token = is_token_valid(config["token"])
     if token:
@@ -1641,13 +2332,9 @@ def scan_operation(
             )
             exit(1)
         if container_names:
-            container_names = [
-                (x.strip()) for x in container_names.strip("[]").split(",")
-            ]
+            container_names = _parse_comma_list(container_names)
         if container_tags:
-            container_tags = [
-                (x.strip()) for x in container_tags.strip("[]").split(",")
-            ]
+            container_tags = _parse_comma_list(container_tags)
         if remediation and (remediation not in ["append", "overwrite", "none"]):
             print(
                 "[bold red] Remediation must be either 'append', 'overwrite', or 'none'. Please try again with "
@@ -1680,7 +2367,7 @@ def operation_status(
         help="Comma-separated list of Operation IDs or array-like format",
     ),
 ):
-    ids = [int(x.strip()) for x in ids.strip("[]").split(",")]
+    ids = _parse_int_list(ids)
     config = load_config()
     token = is_token_valid(config["token"])
     check_operation_status(ids, token=token)
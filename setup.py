@@ -27,8 +27,8 @@ setup(
     install_requires=[
         "typer[all]",
         "requests",
-        "pyjwt",
         "croniter",
+        "orjson",
     ],
     entry_points={"console_scripts": ["qualytics=qualytics.qualytics:app"]},
     classifiers=[